@@ -1,87 +1,6 @@
-import os
 import sys
-from deep_translator import GoogleTranslator
-from tqdm import tqdm
-import questionary
-import logging
-import time
-
-# Configure logging
-logging.basicConfig(filename='translation_log.txt', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
-def translate_text(text, src='auto', dest='en'):
-    """
-    Translate text using the deep_translator library.
-    """
-    translator = GoogleTranslator(source=src, target=dest)
-    try:
-        # Splitting the text into manageable parts if necessary
-        parts = text.split('\n')
-        translated_text = []
-        progress_bar = tqdm(total=len(parts), desc="Translating", unit="line")
-
-        for part in parts:
-            if part.strip():  # Only translate non-empty lines
-                translated = translator.translate(part)
-                translated_text.append(translated)
-            else:
-                translated_text.append(part)  # Keep empty lines to maintain formatting
-            progress_bar.update(1)
-
-        progress_bar.close()
-        return '\n'.join(translated_text)
-    except Exception as e:
-        logging.error(f"Translation failed: {e}")
-        progress_bar.close()
-        return None
-
-def translate_file(input_file_path, output_file_path, src_language='auto', dest_language='en', is_script=False):
-    """
-    Translate the contents of a file.
-    """
-    try:
-        start_time = time.time()
-        with open(input_file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        translated_content = translate_text(content, src=src_language, dest=dest_language)
-        
-        with open(output_file_path, 'w', encoding='utf-8') as file:
-            file.write(translated_content)
-        
-        total_time = time.time() - start_time
-        logging.info(f"Translation complete: {output_file_path} in {total_time:.2f}s")
-        print(f"Translation complete. Output file created: {output_file_path}")
-        print(f"Translation took {total_time:.2f} seconds.")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        print(f"An error occurred: {e}")
-
-def select_file_and_languages():
-    """
-    Use questionary to let the user select the file and languages for translation.
-    """
-    path = os.getcwd()
-    files = [f for f in os.listdir(path) if os.path.isfile(f)]
-    files.append('Enter file path manually...')
-    file_response = questionary.select("Choose a file to translate or manually enter a file path:", choices=files).ask()
-
-    if file_response == 'Enter file path manually...':
-        file_response = questionary.text("Enter the full file path:").ask()
-
-    is_script = questionary.confirm("Is the file a script that needs to retain formatting?").ask()
-    languages = list(GoogleTranslator.get_supported_languages(as_dict=True).keys())
-    src_language = questionary.select("Select the source language (auto for automatic detection):", choices=['auto'] + languages).ask()
-    dest_language = questionary.select("Select the target language:", choices=languages).ask()
-
-    return file_response, src_language, dest_language, is_script
+from translate_cli import main
 
+# Kept for existing workflows, the translators now live in translate_cli.py
 if __name__ == "__main__":
-    input_file_path, src_language, dest_language, is_script = select_file_and_languages()
-    if not os.path.exists(input_file_path):
-        print("File does not exist. Please check the path and try again.")
-        sys.exit(1)
-
-    base, ext = os.path.splitext(input_file_path)
-    output_file_path = f"{base}_translated_{dest_language.upper()}{ext}"
-    translate_file(input_file_path, output_file_path, src_language, dest_language, is_script)
+    sys.exit(main(['interactive', '--provider', 'deep', '--mode', 'lines'] + sys.argv[1:]))
@@ -0,0 +1,304 @@
+import os
+import sys
+import glob
+import heapq
+import logging
+import threading
+import time
+from instrumentation import Metrics, MeteredProvider
+from providers import RateLimitError, TranslationError
+from script_translate import apply_translations, extract_segments
+
+def smart_split(text, max_chunk_size=500):
+    punctuation = '.!?'
+    parts = []
+    last_cut = 0
+    last_punct = 0
+
+    for i, char in enumerate(text):
+        if char in punctuation and i - last_cut < max_chunk_size:
+            last_punct = i + 1
+        elif i - last_cut >= max_chunk_size:
+            cut_point = last_punct if last_punct > last_cut else i + 1
+            parts.append(text[last_cut:cut_point])
+            last_cut = cut_point
+    if last_cut < len(text):
+        parts.append(text[last_cut:])
+    return parts
+
+def line_separator(content):
+    return '\r\n' if '\r\n' in content else '\n'
+
+def resolve_language(language, languages):
+    """
+    Accept either a language code ('de', 'zh-CN') or a language name ('german') known to the
+    provider, in any case, and return the provider's own code.
+    """
+    wanted = language.strip().lower()
+    for code, name in languages.items():
+        if wanted in (code.lower(), name.lower()):
+            return code
+    raise ValueError(f"Unknown language: {language}")
+
+def collect_files(sources, pattern='*.txt', recursive=False):
+    """
+    Expand directories and glob patterns into a sorted list of files, skipping our own outputs
+    (<name>_translated_<LANG><ext> and the older <name>_translated.txt) and logs.
+    """
+    files = set()
+    for source in sources:
+        if os.path.isdir(source):
+            sub = os.path.join('**', pattern) if recursive else pattern
+            matches = glob.glob(os.path.join(source, sub), recursive=recursive)
+        else:
+            matches = glob.glob(source, recursive=recursive)
+        for match in matches:
+            name = os.path.basename(match)
+            translated = '_translated_' in name or os.path.splitext(name)[0].endswith('_translated')
+            if os.path.isfile(match) and not translated and not name.startswith(('translation_log', 'translation_report')):
+                files.add(match)
+    return sorted(files)
+
+class RateLimiter:
+    """
+    Token bucket shared by every worker so the whole batch stays inside the provider quota.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class FileJob:
+    """
+    One file translated into one language. `mode` decides how the file is cut into parts and
+    put back together: 'chunks' (sentence-aware chunks joined by spaces), 'lines' (line by line,
+    formatting kept) or 'script' (comments and docstrings only, code kept byte-identical).
+    In the last two modes `units` holds the lines or comment texts and `spans` the range of
+    `parts` each unit was split into to fit the provider's chunk size.
+    """
+    def __init__(self, path, dest_lang, parts, mode='chunks', content=None, segments=None, output_path=None,
+                 units=None, spans=None):
+        self.path = path
+        self.dest_lang = dest_lang
+        self.parts = parts
+        self.units = units
+        self.spans = spans
+        self.mode = mode
+        self.content = content
+        self.segments = segments
+        self.results = [part if not part.strip() else None for part in parts]  # Blank parts are kept as is
+        self.pending = [index for index, part in enumerate(parts) if part.strip()]
+        self.remaining = len(self.pending)
+        self.chars = sum(len(part) for part in parts)
+        self.started = None
+        self.finished = None
+        self.error = None  # Set when the output could not be written
+        self._output_path = output_path
+
+    @property
+    def output_path(self):
+        if self._output_path:
+            return self._output_path
+        base, ext = os.path.splitext(self.path)
+        return f"{base}_translated_{self.dest_lang.upper()}{ext}"
+
+    def unit_results(self):
+        if self.spans is None:
+            return self.results
+        return [' '.join(self.results[start:end]) for start, end in self.spans]
+
+    def render(self):
+        if self.mode == 'script':
+            return apply_translations(self.content, self.segments, dict(zip(self.units, self.unit_results())))
+        return (line_separator(self.content) if self.mode == 'lines' else ' ').join(self.unit_results())
+
+    @property
+    def elapsed(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+class BatchScheduler:
+    """
+    Fans every (file, chunk, language) work item into one shared queue served by a pool of
+    workers. Items are ordered by the size of the job they belong to, so small files finish
+    first instead of waiting behind large ones, while the rate limiter keeps the quota saturated.
+    Chunk size, batch size, worker count and request rate default to the provider's limits.
+    Chunks already translated into the same language are served from a cache.
+    """
+    def __init__(self, provider, src_lang='auto', num_threads=None, rate=None, max_retries=3, metrics=None):
+        self.metrics = metrics or Metrics()
+        self.provider = MeteredProvider(provider, self.metrics)
+        self.src_lang = src_lang
+        self.num_threads = num_threads or provider.max_concurrency
+        self.limiter = RateLimiter(rate or provider.rate_limit)
+        self.max_retries = max_retries
+        self.max_chunk_size = provider.max_chunk_size
+        self.max_batch_size = provider.max_batch_size
+        self.jobs = []
+        self.heap = []
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.failed_chunks = 0
+        self.failed_jobs = 0
+
+    def add_file(self, path, dest_langs, mode='chunks', output_path=None):
+        with open(path, 'r', encoding='utf-8', newline='') as file:  # Keep CRLF line endings as they are
+            content = file.read()
+        segments = units = spans = None
+        if mode == 'script':
+            segments = extract_segments(content, path)
+            units = list(dict.fromkeys(segment.text for segment in segments))
+            self.metrics.record_cache_hits((len(segments) - len(units)) * len(dest_langs))
+        elif mode == 'lines':
+            units = content.split(line_separator(content))
+        if units is None:
+            parts = smart_split(content, self.max_chunk_size)
+        else:
+            parts, spans = self.split_units(units)
+        for dest_lang in dest_langs:
+            job = FileJob(path, dest_lang, parts, mode, content, segments, output_path, units, spans)
+            self.jobs.append(job)
+            self.metrics.record_chunks([len(parts[index]) for index in job.pending])
+            if not job.pending:
+                job.started = job.finished = time.monotonic()
+                self.write_output(job)
+                continue
+            for index in job.pending:
+                heapq.heappush(self.heap, (len(job.pending), len(self.jobs), index, job))
+
+    def split_units(self, units):
+        """
+        Split lines or comments longer than the provider's chunk size, remembering which parts
+        belong to which unit so they can be joined back.
+        """
+        parts = []
+        spans = []
+        for unit in units:
+            pieces = smart_split(unit, self.max_chunk_size) if len(unit) > self.max_chunk_size else [unit]
+            spans.append((len(parts), len(parts) + len(pieces)))
+            parts.extend(pieces)
+        return parts, spans
+
+    def next_batch(self):
+        """
+        Pop the next item plus as many following items for the same language as one request takes.
+        """
+        with self.lock:
+            batch = []
+            while self.heap and len(batch) < self.max_batch_size:
+                if batch and self.heap[0][3].dest_lang != batch[0][0].dest_lang:
+                    break
+                _, _, index, job = heapq.heappop(self.heap)
+                if job.started is None:
+                    job.started = time.monotonic()
+                batch.append((job, index))
+            return batch
+
+    def translate_batch(self, texts, dest_lang):
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                return self.provider.translate_batch(texts, src=self.src_lang, dest=dest_lang)
+            except RateLimitError as e:
+                logging.warning(f"Rate limited ({dest_lang}, attempt {attempt + 1}): {e}")
+                delay = min(2 ** (attempt + 2), 30)
+            except TranslationError as e:
+                logging.error(f"Translation error ({dest_lang}, attempt {attempt + 1}): {e}")
+                delay = min(2 ** attempt, 10)
+            if attempt < self.max_retries:
+                self.metrics.record_retry()
+                time.sleep(delay)
+        with self.lock:
+            self.failed_chunks += len(texts)
+        return texts  # Keep the original text rather than dropping the chunks
+
+    def worker(self):
+        while True:
+            batch = self.next_batch()
+            if not batch:
+                return
+            dest_lang = batch[0][0].dest_lang
+            texts = [job.parts[index] for job, index in batch]
+            with self.lock:
+                missing = list(dict.fromkeys(text for text in texts if (text, dest_lang) not in self.cache))
+            self.metrics.record_cache_hits(len(texts) - len(missing))
+            if missing:
+                translated = self.translate_batch(missing, dest_lang)
+                with self.lock:
+                    for text, result in zip(missing, translated):
+                        if result is not text:  # Untranslated fallbacks are not worth caching
+                            self.cache[(text, dest_lang)] = result
+            finished = []
+            with self.lock:
+                for job, index in batch:
+                    job.results[index] = self.cache.get((job.parts[index], dest_lang), job.parts[index])
+                    job.remaining -= 1
+                    if job.remaining == 0:
+                        job.finished = time.monotonic()
+                        finished.append(job)
+            self.metrics.record_done(len(batch))
+            for job in finished:
+                self.write_output(job)
+
+    def write_output(self, job):
+        try:
+            with open(job.output_path, 'w', encoding='utf-8', newline='') as output_file:
+                output_file.write(job.render())
+        except OSError as e:
+            logging.error(f"Could not write {job.output_path}: {e}")
+            job.error = e
+            with self.lock:
+                self.failed_jobs += 1
+            return
+        logging.info(f"Translation complete: {job.output_path} in {job.elapsed:.2f}s")
+
+    def run(self):
+        start_time = time.monotonic()
+        threads = [threading.Thread(target=self.worker) for _ in range(self.num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.metrics.finish()
+        self.metrics.extra['files'] = [
+            {'path': job.path, 'dest_lang': job.dest_lang, 'chunks': len(job.pending), 'chars': job.chars,
+             'seconds': job.elapsed, 'chars_per_second': job.chars / job.elapsed if job.elapsed else 0.0}
+            for job in self.jobs
+        ]
+        self.metrics.extra['failed_chunks'] = self.failed_chunks
+        self.metrics.extra['failed_files'] = self.failed_jobs
+        return time.monotonic() - start_time
+
+    def report(self, total_time):
+        print(f"{'File':<50} {'Lang':<6} {'Chunks':>7} {'Chars':>9} {'Time (s)':>9} {'Chars/s':>9}")
+        for job in sorted(self.jobs, key=lambda job: (job.path, job.dest_lang)):
+            rate = job.chars / job.elapsed if job.elapsed else 0.0
+            print(f"{job.path:<50} {job.dest_lang:<6} {len(job.pending):>7} {job.chars:>9} {job.elapsed:>9.2f} {rate:>9.1f}")
+        total_chars = sum(job.chars for job in self.jobs)
+        total_chunks = sum(len(job.pending) for job in self.jobs)
+        print(f"Total: {len(self.jobs)} translations, {total_chunks} chunks, {total_chars} chars in {total_time:.2f}s "
+              f"({total_chars / total_time if total_time else 0.0:.1f} chars/s, {total_chunks / total_time if total_time else 0.0:.2f} chunks/s)")
+        if self.failed_chunks:
+            print(f"{self.failed_chunks} chunks could not be translated and were kept in the source language.")
+        for job in self.jobs:
+            if job.error:
+                print(f"Could not write {job.output_path}: {job.error}")
+
+if __name__ == '__main__':
+    from translate_cli import main
+    sys.exit(main(['batch'] + sys.argv[1:]))
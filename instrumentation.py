@@ -0,0 +1,170 @@
+import bisect
+import json
+import threading
+import time
+from providers import RateLimitError, TranslationError, TranslationProvider
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+CHUNK_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000)  # characters
+
+def histogram(values, buckets):
+    """
+    Count values into `<= bucket` bins plus an overflow bin, keyed by the bucket label.
+    """
+    counts = [0] * (len(buckets) + 1)
+    for value in values:
+        counts[bisect.bisect_left(buckets, value)] += 1
+    labels = [f"<={bucket}" for bucket in buckets] + [f">{buckets[-1]}"]
+    return dict(zip(labels, counts))
+
+def summary(values):
+    if not values:
+        return {'count': 0}
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        'count': len(ordered),
+        'min': ordered[0],
+        'mean': sum(ordered) / len(ordered),
+        'p50': pick(0.5),
+        'p90': pick(0.9),
+        'p99': pick(0.99),
+        'max': ordered[-1],
+    }
+
+class Metrics:
+    """
+    Thread-safe counters for one translation run, turned into a JSON report at the end.
+    """
+    def __init__(self, progress=None):
+        self.lock = threading.Lock()
+        self.progress = progress
+        self.started = time.monotonic()
+        self.finished = None
+        self.chunk_sizes = []
+        self.latencies = []
+        self.requests = 0
+        self.translated_chars = 0
+        self.retries = 0
+        self.failures = 0
+        self.rate_limits = 0
+        self.cache_hits = 0
+        self.extra = {}
+
+    def record_chunks(self, sizes):
+        with self.lock:
+            self.chunk_sizes.extend(sizes)
+        if self.progress:
+            self.progress.add_total(len(sizes))
+
+    def record_request(self, latency, chars, error=None):
+        with self.lock:
+            self.requests += 1
+            self.latencies.append(latency)
+            if isinstance(error, RateLimitError):
+                self.rate_limits += 1
+            elif error is not None:
+                self.failures += 1
+            else:
+                self.translated_chars += chars
+
+    def record_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def record_cache_hits(self, count=1):
+        with self.lock:
+            self.cache_hits += count
+
+    def record_done(self, count=1):
+        if self.progress:
+            self.progress.advance(count)
+
+    def finish(self):
+        self.finished = time.monotonic()
+        if self.progress:
+            self.progress.close()
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    def report(self):
+        with self.lock:
+            elapsed = self.elapsed
+            return {
+                'elapsed_seconds': elapsed,
+                'chunks': {
+                    **summary(self.chunk_sizes),
+                    'total_chars': sum(self.chunk_sizes),
+                    'histogram': histogram(self.chunk_sizes, CHUNK_BUCKETS),
+                },
+                'requests': {
+                    'count': self.requests,
+                    'latency_seconds': summary(self.latencies),
+                    'latency_histogram': histogram(self.latencies, LATENCY_BUCKETS),
+                },
+                'retries': self.retries,
+                'failures': self.failures,
+                'rate_limit_events': self.rate_limits,
+                'cache_hits': self.cache_hits,
+                'translated_chars': self.translated_chars,
+                'chars_per_second': self.translated_chars / elapsed if elapsed else 0.0,
+                **self.extra,
+            }
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as report_file:
+            json.dump(self.report(), report_file, indent=2)
+        return path
+
+class MeteredProvider(TranslationProvider):
+    """
+    Wraps a provider so every request is timed and classified in `metrics`, while exposing the
+    wrapped provider's limits unchanged.
+    """
+    def __init__(self, provider, metrics):
+        self.provider = provider
+        self.metrics = metrics
+        self.name = provider.name
+        self.max_chunk_size = provider.max_chunk_size
+        self.max_batch_size = provider.max_batch_size
+        self.max_concurrency = provider.max_concurrency
+        self.rate_limit = provider.rate_limit
+
+    def translate(self, text, src='auto', dest='en'):
+        return self.translate_batch([text], src=src, dest=dest)[0]
+
+    def translate_batch(self, texts, src='auto', dest='en'):
+        start = time.monotonic()
+        try:
+            translated = self.provider.translate_batch(texts, src=src, dest=dest)
+        except TranslationError as e:
+            self.metrics.record_request(time.monotonic() - start, 0, error=e)
+            raise
+        self.metrics.record_request(time.monotonic() - start, sum(len(text) for text in texts))
+        return translated
+
+    def supported_languages(self):
+        return self.provider.supported_languages()
+
+class ProgressBar:
+    """
+    Live progress surface on top of tqdm; the total grows as work is discovered.
+    """
+    def __init__(self, desc="Translating", unit="chunk"):
+        from tqdm import tqdm
+        self.bar = tqdm(total=0, desc=desc, unit=unit)
+        self.lock = threading.Lock()
+
+    def add_total(self, count):
+        with self.lock:
+            self.bar.total += count
+            self.bar.refresh()
+
+    def advance(self, count=1):
+        with self.lock:
+            self.bar.update(count)
+
+    def close(self):
+        self.bar.close()
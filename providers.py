@@ -0,0 +1,164 @@
+import random
+import threading
+import time
+
+class TranslationError(Exception):
+    """
+    Raised by every provider when a request fails, whatever the backend library raised.
+    """
+
+class RateLimitError(TranslationError):
+    """
+    The backend refused the request because too many were sent.
+    """
+
+class TranslationProvider:
+    """
+    Base class for translation backends. Each provider declares its limits so callers can
+    size chunks, batches and worker pools for it:
+
+    - max_chunk_size: longest text accepted in one item
+    - max_batch_size: items sent in one request by translate_batch
+    - max_concurrency: requests worth running in parallel
+    - rate_limit: requests per second the backend tolerates
+    """
+    name = 'base'
+    package = None  # pip package the backend needs
+    max_chunk_size = 500
+    max_batch_size = 1
+    max_concurrency = 5
+    rate_limit = 5.0
+
+    def translate(self, text, src='auto', dest='en'):
+        raise NotImplementedError
+
+    def translate_batch(self, texts, src='auto', dest='en'):
+        return [self.translate(text, src=src, dest=dest) for text in texts]
+
+    def supported_languages(self):
+        """
+        Return a dict mapping language codes to language names.
+        """
+        raise NotImplementedError
+
+class GoogletransProvider(TranslationProvider):
+    name = 'googletrans'
+    package = 'googletrans'
+    max_chunk_size = 500
+    max_batch_size = 1  # googletrans sends one request per item even when given a list
+    max_concurrency = 8
+    rate_limit = 5.0
+
+    def __init__(self):
+        import googletrans  # Imported here so either backend can be installed on its own
+        self.module = googletrans
+        self.local = threading.local()  # Translator keeps an HTTP session, one per thread
+
+    def translate(self, text, src='auto', dest='en'):
+        if not hasattr(self.local, 'translator'):
+            self.local.translator = self.module.Translator()
+        try:
+            return self.local.translator.translate(text, src=src, dest=dest).text
+        except Exception as e:
+            if '429' in str(e) or 'Too Many Requests' in str(e):
+                raise RateLimitError(str(e)) from e
+            raise TranslationError(str(e)) from e
+
+    def supported_languages(self):
+        return dict(self.module.LANGUAGES)
+
+class DeepTranslatorProvider(TranslationProvider):
+    name = 'deep'
+    package = 'deep-translator'
+    max_chunk_size = 4500  # deep_translator rejects anything of 5000 characters or more
+    max_batch_size = 1
+    max_concurrency = 4
+    rate_limit = 3.0
+
+    def __init__(self):
+        from deep_translator import GoogleTranslator, exceptions
+        self.translator_class = GoogleTranslator
+        self.exceptions = exceptions
+        self.local = threading.local()
+
+    def translator(self, src, dest):
+        # GoogleTranslator is bound to a language pair, cache one per pair and thread
+        if not hasattr(self.local, 'translators'):
+            self.local.translators = {}
+        key = (src, dest)
+        if key not in self.local.translators:
+            self.local.translators[key] = self.translator_class(source=src, target=dest)
+        return self.local.translators[key]
+
+    def translate(self, text, src='auto', dest='en'):
+        try:
+            translated = self.translator(src, dest).translate(text)
+        except self.exceptions.TooManyRequests as e:
+            raise RateLimitError(str(e)) from e
+        except Exception as e:
+            raise TranslationError(str(e)) from e
+        return translated if translated is not None else text
+
+    def supported_languages(self):
+        names = self.translator_class().get_supported_languages(as_dict=True)
+        return {code: name for name, code in names.items()}
+
+class MockProvider(TranslationProvider):
+    """
+    Offline stand-in for benchmarking and testing. Translations are deterministic
+    ("[de] text"), each request sleeps `latency + per_char_latency * chars`, and failures
+    are drawn from a seeded generator so a run can be replayed exactly.
+    """
+    name = 'mock'
+    LANGUAGES = {'en': 'english', 'de': 'german', 'fr': 'french', 'es': 'spanish', 'it': 'italian',
+                 'ja': 'japanese', 'zh-cn': 'chinese (simplified)', 'ru': 'russian'}
+
+    def __init__(self, latency=0.05, per_char_latency=0.0, failure_rate=0.0, rate_limit_rate=0.0,
+                 seed=0, max_chunk_size=500, max_batch_size=20, max_concurrency=16, rate_limit=50.0):
+        self.latency = latency
+        self.per_char_latency = per_char_latency
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_chunk_size = max_chunk_size
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def request(self, texts, dest):
+        with self.lock:
+            self.requests += 1
+            roll = self.random.random()
+        time.sleep(self.latency + self.per_char_latency * sum(len(text) for text in texts))
+        if roll < self.rate_limit_rate:
+            raise RateLimitError("Mock rate limit hit")
+        if roll < self.rate_limit_rate + self.failure_rate:
+            raise TranslationError("Mock request failed")
+        return [f"[{dest}] {text}" for text in texts]
+
+    def translate(self, text, src='auto', dest='en'):
+        return self.request([text], dest)[0]
+
+    def translate_batch(self, texts, src='auto', dest='en'):
+        return self.request(texts, dest)
+
+    def supported_languages(self):
+        return dict(self.LANGUAGES)
+
+PROVIDERS = {
+    'googletrans': GoogletransProvider,
+    'deep': DeepTranslatorProvider,
+    'mock': MockProvider,
+}
+
+def get_provider(name='googletrans', **options):
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown provider: {name}. Choose from {', '.join(PROVIDERS)}")
+    provider_class = PROVIDERS[name]
+    try:
+        return provider_class(**options)
+    except ImportError as e:
+        raise ValueError(f"The {name} provider needs the {provider_class.package} package, "
+                         f"install it with: pip install {provider_class.package}") from e
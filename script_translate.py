@@ -0,0 +1,172 @@
+import io
+import os
+import re
+import tokenize
+
+# Comment syntax for the fallback scanner, keyed by file extension
+LINE_COMMENTS = {
+    '': ('#',), '.py': ('#',), '.pyw': ('#',), '.pyi': ('#',),  # Python that tokenize rejects
+    '.sh': ('#',), '.bash': ('#',), '.rb': ('#',), '.pl': ('#',), '.r': ('#',),
+    '.yml': ('#',), '.yaml': ('#',), '.toml': ('#',), '.cfg': ('#',), '.ini': ('#', ';'),
+    '.c': ('//',), '.h': ('//',), '.cpp': ('//',), '.hpp': ('//',), '.cs': ('//',),
+    '.java': ('//',), '.js': ('//',), '.ts': ('//',), '.go': ('//',), '.rs': ('//',),
+    '.swift': ('//',), '.kt': ('//',), '.php': ('//', '#'), '.sql': ('--',), '.lua': ('--',),
+}
+BLOCK_COMMENTS = ('.c', '.h', '.cpp', '.hpp', '.cs', '.java', '.js', '.ts', '.go', '.rs', '.swift', '.kt', '.php', '.css', '.sql')
+DIRECTIVE = re.compile(r'^#!|^#.*coding[:=]|^#\s*(type:|noqa|pragma|pylint:)')
+
+class Segment:
+    """
+    A translatable span of the source: `start`/`end` are character offsets of the text
+    itself, everything outside these spans is copied back unchanged.
+    """
+    def __init__(self, start, end, text, quote=None):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.quote = quote
+
+def _line_offsets(content):
+    # tokenize only breaks lines on '\n', str.splitlines would also split on \x0c, \u2028, ...
+    offsets = [0]
+    for line in content.split('\n'):
+        offsets.append(offsets[-1] + len(line) + 1)
+    return offsets
+
+def _comment_segment(start, comment, marker):
+    body = comment[len(marker):]
+    stripped = body.lstrip()
+    offset = start + len(marker) + len(body) - len(stripped)
+    stripped = stripped.rstrip()
+    return Segment(offset, offset + len(stripped), stripped)
+
+def _docstring_segment(start, token_string):
+    prefix_len = len(token_string) - len(token_string.lstrip('rRbBuUfF'))
+    quote = token_string[prefix_len:prefix_len + 3]
+    if quote not in ('"""', "'''"):
+        quote = token_string[prefix_len]
+    body_start = start + prefix_len + len(quote)
+    body = token_string[prefix_len + len(quote):len(token_string) - len(quote)]
+    stripped = body.strip()  # Keep the layout around the text, e.g. the indent before closing quotes
+    offset = body_start + body.find(stripped) if stripped else body_start
+    return Segment(offset, offset + len(stripped), stripped, quote)
+
+def python_segments(content):
+    """
+    Single pass over the Python token stream, keeping comments and string statements
+    (docstrings). Raises tokenize.TokenError / SyntaxError on sources it cannot parse.
+    """
+    offsets = _line_offsets(content)
+    segments = []
+    line_start = True
+    pending = None
+    for token in tokenize.generate_tokens(io.StringIO(content).readline):
+        start = offsets[token.start[0] - 1] + token.start[1]
+        if token.type == tokenize.COMMENT:
+            if not DIRECTIVE.match(token.string):
+                segments.append(_comment_segment(start, token.string, '#'))
+            continue
+        if token.type in (tokenize.NL, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING):
+            continue
+        if token.type == tokenize.NEWLINE:
+            if pending is not None:
+                segments.append(pending)
+            pending = None
+            line_start = True
+            continue
+        prefix = token.string[:len(token.string) - len(token.string.lstrip('rRbBuUfF'))]
+        if token.type == tokenize.STRING and line_start and not set('bBfF') & set(prefix):
+            pending = _docstring_segment(start, token.string)
+        else:
+            pending = None
+        line_start = False
+    if pending is not None:
+        segments.append(pending)
+    return sorted(segments, key=lambda segment: segment.start)
+
+def scan_segments(content, line_markers=('#',), block=False):
+    """
+    Fallback scanner for non-Python sources: walks the text once, skipping string literals
+    and collecting line comments (and /* */ blocks when `block` is set).
+    """
+    segments = []
+    i = 0
+    length = len(content)
+    while i < length:
+        char = content[i]
+        if char in '"\'`':
+            i += 1
+            while i < length and content[i] != char and (content[i] != '\n' or char == '`'):  # Template literals span lines
+                i += 2 if content[i] == '\\' else 1
+            i += 1
+            continue
+        if block and content.startswith('/*', i):
+            end = content.find('*/', i + 2)
+            end = length if end == -1 else end
+            body = content[i + 2:end]
+            stripped = body.strip(' \t\n*')
+            if stripped:
+                offset = i + 2 + body.index(stripped)
+                segments.append(Segment(offset, offset + len(stripped), stripped, '*/'))
+            i = end + 2
+            continue
+        marker = next((m for m in line_markers if content.startswith(m, i)), None)
+        if marker == '#' and i > 0 and content[i - 1] not in ' \t\n':
+            marker = None  # e.g. $# and ${#arr[@]} in shell, #fff in CSS-like text
+        if marker is not None:
+            end = content.find('\n', i)
+            end = length if end == -1 else end
+            comment = content[i:end]
+            if not (i == 0 and comment.startswith('#!')):
+                segments.append(_comment_segment(i, comment, marker))
+            i = end
+            continue
+        i += 1
+    return segments
+
+def find_segments(content, filename=None):
+    ext = os.path.splitext(filename or '')[1].lower()
+    if ext in ('', '.py', '.pyw', '.pyi'):
+        try:
+            return python_segments(content)
+        except (tokenize.TokenError, SyntaxError):
+            pass  # Not valid Python after all, let the scanner handle it
+    return scan_segments(content, LINE_COMMENTS.get(ext, ()), ext in BLOCK_COMMENTS)
+
+def _fit_quote(text, quote):
+    """
+    Make a translation safe to put back between the original delimiters.
+    """
+    if quote is None:
+        return text.replace('\n', ' ')  # A translated line comment must stay on its line
+    if quote == '*/':
+        return text.replace('*/', '* /')
+    if len(quote) == 1:
+        text = text.replace('\n', '\\n')
+    text = text.replace(quote, '\\' + quote)
+    if text.endswith(quote[0]) or text.endswith('\\'):
+        text += ' '
+    return text
+
+def extract_segments(content, filename=None):
+    """
+    Segments worth sending to a translator, i.e. the ones containing at least one letter.
+    """
+    return [s for s in find_segments(content, filename) if any(c.isalpha() for c in s.text)]
+
+def apply_translations(content, segments, translations):
+    """
+    Splice translated segment texts back into `content`; segments missing from `translations`
+    or translated to themselves are left exactly as they were.
+    """
+    output = []
+    last = 0
+    for segment in segments:
+        translated = translations.get(segment.text, segment.text)
+        if translated == segment.text:
+            continue
+        output.append(content[last:segment.start])
+        output.append(_fit_quote(translated, segment.quote))
+        last = segment.end
+    output.append(content[last:])
+    return ''.join(output)
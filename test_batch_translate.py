@@ -0,0 +1,73 @@
+import pytest
+import batch_translate
+import providers
+from batch_translate import BatchScheduler
+from providers import MockProvider
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    # Latency and retry backoff would only slow the tests down
+    monkeypatch.setattr(providers.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(batch_translate.time, 'sleep', lambda seconds: None)
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def run(provider, *paths, max_retries=3):
+    scheduler = BatchScheduler(provider, num_threads=1, rate=1000.0, max_retries=max_retries)
+    for path in paths:
+        scheduler.add_file(path, ['de'])
+    scheduler.run()
+    return scheduler, scheduler.metrics.report()
+
+def sentences(count):
+    return ' '.join(f"Sentence number {i} is here." for i in range(count))
+
+def test_failed_requests_are_retried(tmp_path):
+    path = write(tmp_path, 'a.txt', sentences(40))
+    scheduler, report = run(MockProvider(failure_rate=0.5, seed=1, max_chunk_size=100, max_batch_size=1), path, max_retries=20)
+    assert report['retries'] == report['failures'] > 0
+    assert scheduler.failed_chunks == 0
+    assert all(result.startswith('[de] ') for result in scheduler.jobs[0].results)
+
+def test_chunks_that_keep_failing_fall_back_to_the_source(tmp_path):
+    path = write(tmp_path, 'a.txt', sentences(3))
+    scheduler, report = run(MockProvider(failure_rate=1.0, max_batch_size=1), path, max_retries=2)
+    assert report['retries'] == 2
+    assert report['failures'] == 3
+    assert scheduler.failed_chunks == 1
+    with open(scheduler.jobs[0].output_path, encoding='utf-8') as output_file:
+        assert output_file.read() == sentences(3)
+
+def test_chunks_are_batched_up_to_the_provider_limit(tmp_path):
+    path = write(tmp_path, 'a.txt', sentences(60))
+    provider = MockProvider(max_chunk_size=100, max_batch_size=5)
+    scheduler, report = run(provider, path)
+    chunks = len(scheduler.jobs[0].parts)
+    assert chunks > 5
+    assert provider.requests == report['requests']['count'] == -(-chunks // 5)
+
+def test_repeated_chunks_are_cache_hits(tmp_path):
+    first = write(tmp_path, 'a.txt', sentences(20))
+    second = write(tmp_path, 'b.txt', sentences(20))
+    provider = MockProvider(max_chunk_size=100, max_batch_size=1)
+    scheduler, report = run(provider, first, second)
+    chunks = len(scheduler.jobs[0].parts)
+    assert report['cache_hits'] == chunks
+    assert provider.requests == chunks
+    assert scheduler.jobs[0].results == scheduler.jobs[1].results
+
+def test_rate_limit_events_are_counted(tmp_path):
+    path = write(tmp_path, 'a.txt', sentences(3))
+    scheduler, report = run(MockProvider(rate_limit_rate=1.0, max_batch_size=1), path, max_retries=1)
+    assert report['rate_limit_events'] == 2
+    assert report['failures'] == 0
+    assert report['retries'] == 1
+    assert scheduler.failed_chunks == 1
+
+def test_collect_files_skips_both_output_names(tmp_path):
+    for name in ('notes.txt', 'notes_translated.txt', 'notes_translated_DE.txt', 'translation_log.txt'):
+        write(tmp_path, name, 'text')
+    assert batch_translate.collect_files([str(tmp_path)]) == [str(tmp_path / 'notes.txt')]
@@ -0,0 +1,53 @@
+from script_translate import apply_translations, extract_segments
+
+def tag(texts):
+    return ['[de] ' + text for text in texts]
+
+def translate_script(content, translate, filename):
+    segments = extract_segments(content, filename)
+    texts = [segment.text for segment in segments]
+    return apply_translations(content, segments, dict(zip(texts, translate(texts))))
+
+def test_form_feed_keeps_offsets():
+    content = 'x = 1\n\x0c\ndef f():\n    """Doc string."""\n    # ok\n'
+    assert translate_script(content, tag, 'a.py') == 'x = 1\n\x0c\ndef f():\n    """[de] Doc string."""\n    # [de] ok\n'
+
+def test_line_separator_inside_string_keeps_offsets():
+    content = 's = "a\u2028b"\nx = 1  # tail comment\n'
+    assert translate_script(content, tag, 'a.py') == 's = "a\u2028b"\nx = 1  # [de] tail comment\n'
+
+def test_crlf_is_kept():
+    content = 'a = 1  # hello there\r\nb = 2\r\n'
+    assert translate_script(content, tag, 'a.py') == 'a = 1  # [de] hello there\r\nb = 2\r\n'
+
+def test_code_is_untouched_without_translation():
+    content = 'def f():\n    """Doc."""\n    return "# not a comment"  # real one\n'
+    assert translate_script(content, list, 'a.py') == content
+
+def test_css_has_no_line_comments():
+    content = '#main {\n  color: #fff; /* brand colour */\n}\n'
+    assert translate_script(content, tag, 'a.css') == '#main {\n  color: #fff; /* [de] brand colour */\n}\n'
+
+def test_unknown_extension_has_no_line_comments():
+    content = '# heading\ntext\n'
+    assert translate_script(content, tag, 'notes.md') == content
+
+def test_shell_hash_inside_words_is_code():
+    content = 'x=$#  # count args\nn=${#arr[@]}\n'
+    assert translate_script(content, tag, 'a.sh') == 'x=$#  # [de] count args\nn=${#arr[@]}\n'
+
+def test_template_literal_spans_lines():
+    content = 'const s = `first line\nsee http://example.com`;  // real comment\n'
+    assert translate_script(content, tag, 'a.js') == 'const s = `first line\nsee http://example.com`;  // [de] real comment\n'
+
+def test_docstring_starting_with_prefix_letter():
+    content = 'def g():\n    "fetch the feed"\n    return b"bytes"\n'
+    assert translate_script(content, tag, 'a.py') == 'def g():\n    "[de] fetch the feed"\n    return b"bytes"\n'
+
+def test_bytes_and_fstring_statements_are_skipped():
+    content = 'b"raw bytes"\nf"formatted {x}"\n'
+    assert translate_script(content, tag, 'a.py') == content
+
+def test_broken_python_falls_back_to_the_scanner():
+    content = 'def f(:\n  # comment here\n'
+    assert translate_script(content, tag, 'a.py') == 'def f(:\n  # [de] comment here\n'
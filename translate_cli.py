@@ -0,0 +1,233 @@
+"""
+Single entry point for the translation tools:
+
+    python translate_cli.py text notes.txt -l de
+    python translate_cli.py text notes.txt -l de --mode lines --provider deep
+    python translate_cli.py script tool.py -l de -l fr
+    python translate_cli.py batch docs/ -l de -l fr --recursive --progress
+    python translate_cli.py languages --provider deep
+    python translate_cli.py interactive
+
+Translation backends, tqdm and questionary are only imported by the command that needs them,
+and the language list is cached on disk, so non-interactive calls start fast.
+"""
+import argparse
+import os
+import sys
+import time
+
+PROVIDER_NAMES = ('googletrans', 'deep', 'mock')  # Keys of providers.PROVIDERS
+MODES = ('chunks', 'lines', 'script')  # See batch_translate.FileJob
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'tiktok-live-translate')
+
+def setup_logging():
+    import logging
+    logging.basicConfig(filename='translation_log.txt', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def make_provider(args, parser):
+    from providers import MockProvider, get_provider
+    if args.provider == 'mock':
+        return MockProvider(latency=args.mock_latency, per_char_latency=args.mock_per_char_latency,
+                            failure_rate=args.mock_failure_rate, rate_limit_rate=args.mock_rate_limit_rate,
+                            seed=args.mock_seed, max_chunk_size=args.mock_chunk_size, max_batch_size=args.mock_batch_size,
+                            max_concurrency=args.mock_concurrency, rate_limit=args.mock_rate_limit)
+    try:
+        return get_provider(args.provider)
+    except ValueError as e:
+        parser.error(str(e))
+
+def load_languages(args, parser, refresh=False):
+    """
+    Return the provider's {code: name} language list, cached on disk so building a menu or
+    resolving a language name does not import the backend or hit the network.
+    """
+    import json
+    path = os.path.join(CACHE_DIR, f"languages_{args.provider}.json")
+    if not refresh and args.provider != 'mock':
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            pass
+    languages = make_provider(args, parser).supported_languages()
+    if args.provider != 'mock':
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as cache_file:
+                json.dump(languages, cache_file)
+        except OSError:
+            pass  # Caching is best effort
+    return languages
+
+def resolve_languages(args, parser):
+    from batch_translate import resolve_language
+    languages = load_languages(args, parser)
+    try:
+        src = 'auto' if args.src_lang == 'auto' else resolve_language(args.src_lang, languages)
+        return src, [resolve_language(lang, languages) for lang in args.dest_langs]
+    except ValueError as e:
+        parser.error(str(e))
+
+def run_jobs(args, parser, files, src_lang, dest_langs, output_path=None, quiet=False):
+    from batch_translate import BatchScheduler
+    from instrumentation import Metrics, ProgressBar
+    setup_logging()
+    provider = make_provider(args, parser)
+    metrics = Metrics(progress=ProgressBar() if args.progress else None)
+    metrics.extra['provider'] = provider.name
+    scheduler = BatchScheduler(provider, src_lang=src_lang, num_threads=args.threads, rate=args.rate, metrics=metrics)
+    for path in files:
+        scheduler.add_file(path, dest_langs, mode=args.mode, output_path=output_path)
+    total_time = scheduler.run()
+    if quiet:
+        for job in scheduler.jobs:
+            if job.error:
+                print(f"Could not write {job.output_path}: {job.error}", file=sys.stderr)
+            else:
+                print(f"Translation complete. Output file created: {job.output_path}")
+        print(f"Translation took {total_time:.2f} seconds.")
+    else:
+        scheduler.report(total_time)
+    report_path = args.report
+    if report_path is None and not quiet:
+        report_path = time.strftime('translation_report_%Y%m%d_%H%M%S.json')
+    if report_path:
+        print(f"Run report saved as {metrics.write_report(report_path)}")
+    return 1 if scheduler.failed_chunks or scheduler.failed_jobs else 0
+
+def cmd_text(args, parser):
+    if not os.path.isfile(args.file):
+        print("File does not exist. Please check the path and try again.", file=sys.stderr)
+        return 1
+    if args.output and len(args.dest_langs) > 1:
+        parser.error("--output can only be used with a single target language")
+    src_lang, dest_langs = resolve_languages(args, parser)
+    return run_jobs(args, parser, [args.file], src_lang, dest_langs, output_path=args.output, quiet=True)
+
+def cmd_batch(args, parser):
+    from batch_translate import collect_files
+    files = collect_files(args.sources, args.pattern, args.recursive)
+    if not files:
+        print("No files matched. Please check the path and try again.", file=sys.stderr)
+        return 1
+    src_lang, dest_langs = resolve_languages(args, parser)
+    return run_jobs(args, parser, files, src_lang, dest_langs)
+
+def cmd_languages(args, parser):
+    for code, name in sorted(load_languages(args, parser, refresh=args.refresh).items()):
+        print(f"{code}\t{name}")
+    return 0
+
+def cmd_interactive(args, parser):
+    """
+    Menu driven flow the standalone scripts used to offer: pick a file, a mode and languages.
+    """
+    import questionary
+    files = [f for f in os.listdir('.') if os.path.isfile(f)]
+    files.append('Enter file path manually...')
+    args.file = questionary.select("Choose a file to translate or manually enter a file path:", choices=files).ask()
+    if args.file == 'Enter file path manually...':
+        args.file = questionary.text("Enter the full file path:").ask()
+    if args.file is None:
+        return 1
+    if args.mode is None:
+        args.mode = questionary.select("How should the file be translated?", choices=[
+            questionary.Choice("Plain text", 'chunks'),
+            questionary.Choice("Line by line, keeping the formatting", 'lines'),
+            questionary.Choice("Script (comments and docstrings only)", 'script'),
+        ]).ask()
+    languages = load_languages(args, parser)
+    names = sorted(languages.values())
+    codes = {name: code for code, name in languages.items()}
+    src_name = questionary.select("Select the source language (auto for automatic detection):", choices=['auto'] + names).ask()
+    dest_name = questionary.select("Select the target language:", choices=names).ask()
+    if args.mode is None or src_name is None or dest_name is None:
+        return 1
+    args.src_lang = 'auto' if src_name == 'auto' else codes[src_name]
+    args.dest_langs = [codes[dest_name]]
+    args.output = f"{os.path.splitext(args.file)[0]}_translated.txt" if args.legacy_output else None
+    return cmd_text(args, parser)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='translate_cli.py', description="Translate text files and scripts.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    engine = argparse.ArgumentParser(add_help=False)
+    engine.add_argument('--provider', choices=PROVIDER_NAMES, default='googletrans', help="Translation backend")
+    engine.add_argument('--src-lang', default='auto', help="Source language code or name (auto for detection)")
+    engine.add_argument('--threads', type=int, help="Number of concurrent workers (default: provider limit)")
+    engine.add_argument('--rate', type=float, help="Maximum requests per second (default: provider limit)")
+    engine.add_argument('--report', help="Write a JSON run report to this path")
+    engine.add_argument('--progress', action='store_true', help="Show a live progress bar")
+
+    mock = argparse.ArgumentParser(add_help=False)
+    group = mock.add_argument_group("mock provider")
+    group.add_argument('--mock-latency', type=float, default=0.05, help="Seconds per request")
+    group.add_argument('--mock-per-char-latency', type=float, default=0.0, help="Extra seconds per character sent")
+    group.add_argument('--mock-failure-rate', type=float, default=0.0, help="Share of requests that fail")
+    group.add_argument('--mock-rate-limit-rate', type=float, default=0.0, help="Share of requests refused as rate limited")
+    group.add_argument('--mock-seed', type=int, default=0, help="Seed of the failure generator")
+    group.add_argument('--mock-chunk-size', type=int, default=500, help="Declared max_chunk_size")
+    group.add_argument('--mock-batch-size', type=int, default=20, help="Declared max_batch_size")
+    group.add_argument('--mock-concurrency', type=int, default=16, help="Declared max_concurrency")
+    group.add_argument('--mock-rate-limit', type=float, default=50.0, help="Declared rate_limit in requests per second")
+
+    targets = argparse.ArgumentParser(add_help=False)
+    targets.add_argument('-l', '--dest-lang', dest='dest_langs', action='append', required=True,
+                         help="Target language code or name; repeat for several languages")
+
+    text = subparsers.add_parser('text', parents=[engine, mock, targets], help="Translate one file")
+    text.add_argument('file')
+    text.add_argument('--mode', choices=MODES, default='chunks', help="chunks: plain text, lines: keep line layout, script: comments only")
+    text.add_argument('-o', '--output', help="Output path (default: <name>_translated_<LANG><ext>)")
+    text.set_defaults(handler=cmd_text)
+
+    script = subparsers.add_parser('script', parents=[engine, mock, targets], help="Translate the comments and docstrings of one script")
+    script.add_argument('file')
+    script.add_argument('-o', '--output', help="Output path (default: <name>_translated_<LANG><ext>)")
+    script.set_defaults(handler=cmd_text, mode='script')
+
+    batch = subparsers.add_parser('batch', parents=[engine, mock, targets], help="Translate every file in directories or globs")
+    batch.add_argument('sources', nargs='+')
+    batch.add_argument('--mode', choices=MODES, default='chunks')
+    batch.add_argument('--pattern', default='*.txt', help="File pattern used when a source is a directory")
+    batch.add_argument('--recursive', action='store_true', help="Descend into sub-directories")
+    batch.set_defaults(handler=cmd_batch)
+
+    languages = subparsers.add_parser('languages', parents=[mock], help="List the languages a provider supports")
+    languages.add_argument('--provider', choices=PROVIDER_NAMES, default='googletrans')
+    languages.add_argument('--refresh', action='store_true', help="Ignore the cached list")
+    languages.set_defaults(handler=cmd_languages)
+
+    interactive = subparsers.add_parser('interactive', parents=[engine, mock], help="Choose the file and languages from menus")
+    interactive.add_argument('--mode', choices=MODES)
+    interactive.add_argument('--legacy-output', action='store_true', help=argparse.SUPPRESS)  # <name>_translated.txt, see 1.py
+    interactive.set_defaults(handler=cmd_interactive)
+    return parser
+
+def legacy_main(argv):
+    """
+    Entry point of the 2.py and 3.py shims. Their option style calls (--file-path, --file-type,
+    --src-lang/--src-language, --dest-lang/--dest-language) ran without prompts and wrote
+    <name>_translated.txt, so those are mapped onto `text`; anything else opens the menus.
+    """
+    legacy = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    legacy.add_argument('--file-path')
+    legacy.add_argument('--file-type', default='plain')
+    legacy.add_argument('--src-lang', '--src-language', dest='src_lang', default='auto')
+    legacy.add_argument('--dest-lang', '--dest-language', dest='dest_lang', default='en')
+    known, rest = legacy.parse_known_args(argv)
+    if known.file_path is None:
+        return main(['interactive', '--provider', 'googletrans', '--legacy-output'] + rest)
+    mode = 'script' if known.file_type.strip().lower() == 'script' else 'chunks'
+    output = f"{os.path.splitext(known.file_path)[0]}_translated.txt"
+    return main(['text', known.file_path, '--mode', mode, '--src-lang', known.src_lang, '-l', known.dest_lang,
+                 '-o', output, '--provider', 'googletrans'] + rest)
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args, parser)
+
+if __name__ == '__main__':
+    sys.exit(main())